@@ -1,40 +1,562 @@
 #!/usr/bin/env python3
+import argparse
+import ast
+import asyncio
+import collections
+import hashlib
+import importlib
+import json
 import os
 import subprocess
 import sys
 import shutil
-import tkinter as tk
-from tkinter import filedialog, simpledialog, messagebox
+import stat
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+DESKTOP_TMPL = "[Desktop Entry]\nType=Application\nName={name}\nExec={exec_}\nIcon={icon}\nTerminal={term}\nCategories=Utility;\n"
+
+# Modules most GUI apps never need; leaving them out shrinks the bundle and speeds up analysis.
+DEFAULT_EXCLUDES = ["tkinter", "unittest", "pydoc", "test", "distutils"]
+
+EXCLUDES_CONFIG = os.path.join(os.path.expanduser("~"), ".config", "convapp", "excludes.json")
+
+BUILD_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "convapp")
+
+# How many cached builds to keep; older ones are deleted when a new build is stored.
+BUILD_CACHE_KEEP = 20
+
+# Buffer for copies the kernel cannot do for us; large files copy far faster than with the default.
+COPY_BUFSIZE = 4 * 1024 * 1024
+
+# The single Tk interpreter shared by the menu and every converter.
+_ROOT = None
+
+# Directories created during this session, so later conversions skip os.makedirs.
+_MADE_DIRS = set()
+
+# Tools already found during this session, so repeat conversions skip the probe.
+_TOOLS_OK = {}
+
+def _tool_available(tool):
+    """Return True if tool is on PATH. Only stats PATH entries, nothing is spawned."""
+    if _TOOLS_OK.get(tool):
+        return True
+    if shutil.which(tool) is None:
+        return False
+    _TOOLS_OK[tool] = True
+    return True
+
+def _pyinstaller_available():
+    """Return True if PyInstaller can be imported by this interpreter."""
+    if _TOOLS_OK.get("pyinstaller"):
+        return True
+    try:
+        import PyInstaller  # noqa: F401
+    except ImportError:
+        return False
+    _TOOLS_OK["pyinstaller"] = True
+    return True
 
 def check_install_pyinstaller():
     """Check if PyInstaller is installed. If not, install it."""
-    try:
-        result = subprocess.run(["pyinstaller", "--version"],
-                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        if result.returncode != 0:
-            raise Exception("PyInstaller not found")
-    except Exception:
-        if messagebox.askyesno("Install PyInstaller", "PyInstaller is not installed. Install it now? 🤔"):
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "--user", "pyinstaller"])
-        else:
-            messagebox.showerror("Error", "PyInstaller is required to convert scripts. Exiting. 😢")
-            sys.exit(1)
+    from tkinter import messagebox
+    if _pyinstaller_available():
+        return
+    if messagebox.askyesno("Install PyInstaller", "PyInstaller is not installed. Install it now? 🤔"):
+        # Skip pip's version check and prompts; they only add network round trips.
+        subprocess.check_call(
+            [sys.executable, "-m", "pip", "install", "--user", "--disable-pip-version-check",
+             "--no-input", "--no-warn-script-location", "--progress-bar=off", "pyinstaller"],
+            env={**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
+        )
+        # Builds run in a fresh "python -m PyInstaller" process, which will find the new
+        # install even if this one cannot import it yet (e.g. a newly created user site).
+        importlib.invalidate_caches()
+        _TOOLS_OK["pyinstaller"] = True
+    else:
+        messagebox.showerror("Error", "PyInstaller is required to convert scripts. Exiting. 😢")
+        sys.exit(1)
 
 def check_linuxdeploy():
     """Check if linuxdeploy is installed for AppImage packaging."""
-    try:
-        result = subprocess.run(["linuxdeploy", "--version"],
-                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        if result.returncode != 0:
-            raise Exception("linuxdeploy not found")
-    except Exception:
+    from tkinter import messagebox
+    if not _tool_available("linuxdeploy"):
         messagebox.showerror("Error", "linuxdeploy is required for AppImage creation. Install it from https://github.com/linuxdeploy/linuxdeploy 😢")
         sys.exit(1)
 
+def _get_root():
+    """Return the shared Tk root, creating a hidden one if the menu is not running."""
+    import tkinter as tk
+    global _ROOT
+    if _ROOT is None:
+        _ROOT = tk.Tk()
+        _ROOT.withdraw()
+    return _ROOT
+
+def _new_event_loop():
+    """Create an event loop that can drive subprocesses on this platform."""
+    if sys.platform == "win32":
+        return asyncio.ProactorEventLoop()
+    return asyncio.new_event_loop()
+
+async def _pump_tk(root, interval=0.03):
+    """Keep Tk painting and handling input while the event loop is busy."""
+    while True:
+        root.update()
+        await asyncio.sleep(interval)
+
+async def _stream_process(cmd, on_line, state):
+    """Run cmd, passing each line of its output to on_line. Returns the exit code."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT)
+    state["proc"] = proc
+    # Cancel may have been clicked while the process was still starting.
+    if state.get("cancelled"):
+        proc.terminate()
+    try:
+        # Split lines ourselves: StreamReader's line reader fails on lines over 64 KiB.
+        pending = b""
+        while True:
+            chunk = await proc.stdout.read(65536)
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk).split(b"\n")
+            if len(pending) > 65536:
+                lines.append(pending)
+                pending = b""
+            for line in lines:
+                on_line(line.decode(errors="replace").rstrip())
+        if pending:
+            on_line(pending.decode(errors="replace").rstrip())
+        return await proc.wait()
+    finally:
+        # Never leave the child running (and writing into a directory being deleted).
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+
+def _run_async(root, coro):
+    """Run coro to completion while keeping the Tk window responsive."""
+    loop = _new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    async def run():
+        pump = loop.create_task(_pump_tk(root))
+        try:
+            return await coro
+        finally:
+            pump.cancel()
+
+    try:
+        return loop.run_until_complete(run())
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+def _run_with_progress(root, cmd, title):
+    """Run cmd without freezing the GUI, showing its output in a progress window.
+
+    Returns True on success and False if the user cancelled.
+    Raises subprocess.CalledProcessError if the command fails.
+    """
+    import tkinter as tk
+    window = tk.Toplevel(root)
+    window.title(title)
+    status = tk.StringVar(window, value="Starting... ⏳")
+    tk.Label(window, textvariable=status, width=80, anchor="w").pack(padx=10, pady=10)
+
+    state = {"cancelled": False}
+
+    def cancel():
+        state["cancelled"] = True
+        proc = state.get("proc")
+        if proc is not None and proc.returncode is None:
+            proc.terminate()
+
+    tk.Button(window, text="Cancel", width=20, command=cancel).pack(pady=5)
+    window.protocol("WM_DELETE_WINDOW", cancel)
+
+    # Keep the end of the log so a failure can be explained.
+    tail = collections.deque(maxlen=200)
+
+    def show_line(line):
+        tail.append(line)
+        status.set(line)
+
+    try:
+        returncode = _run_async(root, _stream_process(cmd, show_line, state))
+    finally:
+        window.destroy()
+
+    if state["cancelled"]:
+        return False
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, output="\n".join(tail))
+    return True
+
+def _output_tail(error, limit=4096):
+    """Return the end of the output captured for a failed command."""
+    output = error.output or error.stderr or ""
+    if isinstance(output, bytes):
+        output = output.decode(errors="replace")
+    return output[-limit:]
+
+def _move_file(src, dst):
+    """Move src to dst, renaming in place when both are on the same filesystem."""
+    try:
+        os.replace(src, dst)
+    except OSError:
+        # Different filesystems (EXDEV): fall back to copy and delete.
+        shutil.move(src, dst)
+
+def _copy_file(src, dst):
+    """Copy src to dst with its permissions, using sendfile for regular files.
+
+    Raises shutil.SameFileError, like shutil.copy, if src and dst are the same file.
+    """
+    # Opening dst for writing would truncate src before a single byte is read.
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            st = os.fstat(fsrc.fileno())
+            if not stat.S_ISREG(st.st_mode):
+                raise OSError("not a regular file")
+            offset = 0
+            while offset < st.st_size:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, st.st_size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            # No sendfile on this platform, or the source cannot be sent.
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, COPY_BUFSIZE)
+    shutil.copymode(src, dst)
+
+def _ensure_dir(path):
+    """Create path if needed, at most once per session."""
+    if path not in _MADE_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _MADE_DIRS.add(path)
+
+def _build_desktop(name, exec_, icon, use_terminal):
+    """Fill in DESKTOP_TMPL, falling back to a generic icon."""
+    return DESKTOP_TMPL.format_map({
+        "name": name,
+        "exec_": exec_,
+        "icon": icon or "utilities-terminal",
+        "term": "true" if use_terminal else "false",
+    })
+
+def _write_desktop(path, text):
+    """Write an executable .desktop file with a single open/write/close."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    try:
+        # The open mode only applies to new files and is reduced by the umask.
+        os.fchmod(fd, 0o755)
+        data = text.encode("utf-8")
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+def _load_build_options():
+    """Return the (trim, extra_excludes) choice saved by the last conversion."""
+    try:
+        with open(EXCLUDES_CONFIG) as f:
+            options = json.load(f)
+        return bool(options.get("trim", True)), [str(m) for m in options.get("extra", [])]
+    except (OSError, ValueError, AttributeError, TypeError):
+        return True, []
+
+def _save_build_options(trim, extra_excludes):
+    """Remember the trim choice for the next conversion. Failing to save is harmless."""
+    try:
+        os.makedirs(os.path.dirname(EXCLUDES_CONFIG), exist_ok=True)
+        with open(EXCLUDES_CONFIG, "w") as f:
+            json.dump({"trim": trim, "extra": extra_excludes}, f)
+    except OSError:
+        pass
+
+def _ask_build_options(root):
+    """Ask whether to trim the bundle and which extra modules to exclude."""
+    from tkinter import simpledialog, messagebox
+    saved_trim, saved_extra = _load_build_options()
+    trim = messagebox.askyesno(
+        "Trim Bundle?",
+        f"Leave out rarely needed modules ({', '.join(DEFAULT_EXCLUDES)}) and skip UPX "
+        "compression for a faster build? Modules your script imports itself are kept.",
+        default=messagebox.YES if saved_trim else messagebox.NO
+    )
+    extra = simpledialog.askstring("Exclude Modules", "Extra modules to exclude (comma-separated, optional):",
+                                   initialvalue=", ".join(saved_extra), parent=root)
+    extra_excludes = [module.strip() for module in (extra or "").split(",") if module.strip()]
+    _save_build_options(trim, extra_excludes)
+    return trim, extra_excludes
+
+def _file_imports(path):
+    """Return the top-level names of the modules the file at path imports directly."""
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read())
+    except (OSError, SyntaxError, ValueError):
+        return set()
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.add(node.module.split(".")[0])
+    return modules
+
+def _imported_modules(py_script):
+    """Return the top-level names of the modules py_script imports.
+
+    Imports of the .py files and packages next to the script are followed, so a
+    module only a local helper imports (e.g. tkinter in gui.py) counts as well.
+    """
+    script_dir = os.path.dirname(os.path.abspath(py_script))
+    modules = set()
+    pending = [os.path.abspath(py_script)]
+    seen = set()
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        if os.path.isdir(path):
+            # A local package: any of its files may be imported, relatively or not.
+            for dirpath, _, filenames in os.walk(path):
+                pending.extend(os.path.join(dirpath, name) for name in filenames if name.endswith(".py"))
+            continue
+        for name in _file_imports(path) - modules:
+            modules.add(name)
+            local = os.path.join(script_dir, name)
+            if os.path.exists(os.path.join(local, "__init__.py")):
+                pending.append(local)
+            elif os.path.isfile(local + ".py"):
+                pending.append(local + ".py")
+    return modules
+
+def _pyinstaller_cmd(py_script, app_name, icon_path, no_console_flag, trim=False, extra_excludes=()):
+    """Build the PyInstaller command line for a onefile build.
+
+    With trim, DEFAULT_EXCLUDES that the script does not import are left out and
+    UPX is skipped. extra_excludes are always left out.
+    """
+    # Run the PyInstaller that check_install_pyinstaller found, not whatever is first on PATH.
+    pyinstaller_cmd = [
+        sys.executable, "-m", "PyInstaller",
+        "--onefile",
+        f"--name={app_name}"
+    ]
+    if icon_path:
+        pyinstaller_cmd.append(f"--icon={icon_path}")
+    if no_console_flag:
+        pyinstaller_cmd.append(no_console_flag)
+    excludes = list(extra_excludes)
+    if trim:
+        imported = _imported_modules(py_script)
+        excludes = [module for module in DEFAULT_EXCLUDES if module not in imported] + excludes
+        pyinstaller_cmd.append("--noupx")
+    pyinstaller_cmd.extend(f"--exclude-module={module}" for module in excludes)
+    pyinstaller_cmd.append(py_script)
+    return pyinstaller_cmd
+
+def _make_work_dir():
+    """Create a scratch directory for a build, in RAM when /dev/shm is available."""
+    ram_dir = "/dev/shm"
+    return tempfile.mkdtemp(prefix="convapp-", dir=ram_dir if os.path.isdir(ram_dir) else None)
+
+def _dist_dir(work_dir):
+    """Return where PyInstaller puts the finished build for work_dir.
+
+    It sits next to the build cache rather than in RAM, so storing the build in
+    the cache is a rename instead of a copy.
+    """
+    return os.path.join(BUILD_CACHE_DIR, ".dist-" + os.path.basename(work_dir))
+
+def _rmtrees(*paths):
+    """shutil.rmtree each of paths, ignoring errors."""
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+def _fast_rmtree(*paths):
+    """Delete paths without making the GUI wait for it.
+
+    On Linux a detached rm -rf walks the tree in C; elsewhere a background
+    thread runs shutil.rmtree.
+    """
+    if sys.platform.startswith("linux"):
+        proc = subprocess.Popen(["rm", "-rf", "--", *paths],
+                                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        # Reap rm when it exits so it neither lingers as a zombie nor warns when collected.
+        threading.Thread(target=proc.wait, daemon=True).start()
+    else:
+        threading.Thread(target=_rmtrees, args=paths, daemon=True).start()
+
+def _with_work_paths(pyinstaller_cmd, work_dir):
+    """Point PyInstaller's build and spec output at work_dir and its dist output at _dist_dir."""
+    return pyinstaller_cmd[:-1] + [
+        f"--workpath={os.path.join(work_dir, 'build')}",
+        f"--distpath={_dist_dir(work_dir)}",
+        f"--specpath={work_dir}",
+    ] + pyinstaller_cmd[-1:]
+
+def _hash_tree_stats(digest, directory, prefix, in_package):
+    """Add the path, size and mtime of source files under directory to digest.
+
+    Outside a package only .py files and package subdirectories count. Inside a
+    package every file counts, so data files shipped with it do too.
+    """
+    with os.scandir(directory) as entries:
+        entries = sorted(entries, key=lambda e: e.name)
+    for entry in entries:
+        if entry.name.startswith(".") or entry.name == "__pycache__":
+            continue
+        rel_path = prefix + entry.name
+        if entry.is_dir(follow_symlinks=False):
+            if in_package or os.path.exists(os.path.join(entry.path, "__init__.py")):
+                _hash_tree_stats(digest, entry.path, rel_path + "/", True)
+        elif entry.is_file() and (in_package or entry.name.endswith(".py")):
+            st = entry.stat()
+            digest.update(f"{rel_path}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+
+def _build_cache_path(pyinstaller_cmd):
+    """Return where the build for pyinstaller_cmd is cached.
+
+    The key covers the script, the .py files and packages next to it (which it
+    may import) and every option except the app name, which does not change the
+    binary. Installed dependencies are not covered; rebuild after upgrading them.
+    """
+    py_script = pyinstaller_cmd[-1]
+    digest = hashlib.sha256()
+    with open(py_script, "rb") as f:
+        digest.update(f.read())
+    _hash_tree_stats(digest, os.path.dirname(os.path.abspath(py_script)), "", False)
+    options = [arg for arg in pyinstaller_cmd[:-1] if not arg.startswith("--name=")]
+    digest.update(repr(options).encode())
+    return os.path.join(BUILD_CACHE_DIR, digest.hexdigest(), "exe")
+
+def _use_cached_build(cached_exe):
+    """Return True if cached_exe exists, marking it as recently used."""
+    if not os.path.exists(cached_exe):
+        return False
+    try:
+        os.utime(os.path.dirname(cached_exe))
+    except OSError:
+        pass
+    return True
+
+def _prune_build_cache(keep=BUILD_CACHE_KEEP):
+    """Delete all but the keep most recently used cached builds."""
+    builds = []
+    try:
+        with os.scandir(BUILD_CACHE_DIR) as entries:
+            for entry in entries:
+                try:
+                    # Dot-directories are in-progress dist output, not cached builds.
+                    if entry.is_dir(follow_symlinks=False) and not entry.name.startswith("."):
+                        builds.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue
+    except FileNotFoundError:
+        return
+    builds.sort(reverse=True)
+    for _, path in builds[keep:]:
+        shutil.rmtree(path, ignore_errors=True)
+
+def _store_build(exe_path, cached_exe):
+    """Move a fresh build into the cache, never leaving a partial file behind."""
+    os.makedirs(os.path.dirname(cached_exe), exist_ok=True)
+    tmp_path = f"{cached_exe}.{os.getpid()}.tmp"
+    _move_file(exe_path, tmp_path)
+    os.replace(tmp_path, cached_exe)
+    _prune_build_cache()
+
+def _find_executable(dist_dir, app_name):
+    """Return the path of the executable PyInstaller built, or None."""
+    try:
+        with os.scandir(dist_dir) as entries:
+            candidates = {entry.name: entry.path for entry in entries}
+    except FileNotFoundError:
+        return None
+    # Try with extension (if on Windows)
+    return candidates.get(app_name) or candidates.get(app_name + ".exe")
+
+def _install_executable(cached_exe, app_name):
+    """Install a cached build into the py_apps folder and return its new path.
+
+    The build is hard-linked (or copied, across filesystems) to a temporary name
+    and renamed into place, so a running copy of the old app is never written to.
+    """
+    final_dir = os.path.join(os.path.expanduser("~"), ".local", "share", "applications", "py_apps")
+    os.makedirs(final_dir, exist_ok=True)
+    final_exe_path = os.path.join(final_dir, app_name)
+    if os.path.exists(final_exe_path) and os.path.samefile(cached_exe, final_exe_path):
+        # Already installed from this build; renaming a link onto itself would be a no-op.
+        os.chmod(final_exe_path, 0o755)
+        return final_exe_path
+    tmp_path = f"{final_exe_path}.{os.getpid()}.tmp"
+    try:
+        os.link(cached_exe, tmp_path)
+    except OSError:
+        _copy_file(cached_exe, tmp_path)
+    os.chmod(tmp_path, 0o755)
+    os.replace(tmp_path, final_exe_path)
+    return final_exe_path
+
+def _write_python_desktop_entry(app_name, final_exe_path, icon_path, use_terminal):
+    """Create the .desktop file for an executable built from a Python script."""
+    desktop_entry = _build_desktop(app_name, f'"{final_exe_path}"', icon_path, use_terminal)
+    applications_dir = os.path.join(os.path.expanduser("~"), ".local", "share", "applications")
+    _ensure_dir(applications_dir)
+    desktop_file_path = os.path.join(applications_dir, f"{app_name}.desktop")
+    _write_desktop(desktop_file_path, desktop_entry)
+
+def _bundle_one(py_script, app_name, icon_path, no_console_flag, work_dir, trim=False, extra_excludes=(),
+                rebuild=False):
+    """Build one script inside work_dir and install it as an app.
+
+    Runs in a worker process, so it must not touch Tk. Returns the path of the
+    installed executable and raises on failure. work_dir is removed afterwards.
+    A cached build is reused unless rebuild is set.
+    """
+    # Parallel builds must not share PyInstaller's cache directory.
+    env = dict(os.environ)
+    env["PYINSTALLER_CONFIG_DIR"] = os.path.join(work_dir, "config")
+    try:
+        pyinstaller_cmd = _pyinstaller_cmd(py_script, app_name, icon_path, no_console_flag, trim, extra_excludes)
+        cached_exe = _build_cache_path(pyinstaller_cmd)
+        if rebuild or not _use_cached_build(cached_exe):
+            subprocess.run(_with_work_paths(pyinstaller_cmd, work_dir), env=env,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+            exe_path = _find_executable(_dist_dir(work_dir), app_name)
+            if exe_path is None:
+                raise FileNotFoundError("Executable not found after PyInstaller.")
+            _store_build(exe_path, cached_exe)
+        final_exe_path = _install_executable(cached_exe, app_name)
+        _write_python_desktop_entry(app_name, final_exe_path, icon_path, not no_console_flag)
+        return final_exe_path
+    finally:
+        _rmtrees(work_dir, _dist_dir(work_dir))
+
+async def _job_result(app_name, future):
+    """Wait for a batch job and return (app_name, error), error being None on success."""
+    try:
+        await future
+        return app_name, None
+    except Exception as e:
+        return app_name, e
+
 def convert_python_app():
     """Convert a Python script into an executable and create a desktop entry."""
-    root = tk.Tk()
-    root.withdraw()
+    from tkinter import filedialog, simpledialog, messagebox
+    root = _get_root()
 
     py_script = filedialog.askopenfilename(
         title="Select the Python script to convert",
@@ -61,81 +583,62 @@ def convert_python_app():
 
     use_terminal = messagebox.askyesno("Terminal?", "Should the app run in a terminal window? (No = hidden)")
     no_console_flag = "--noconsole" if not use_terminal else ""
+    trim, extra_excludes = _ask_build_options(root)
 
     check_install_pyinstaller()
 
-    work_dir = os.getcwd()
-    pyinstaller_cmd = [
-        "pyinstaller",
-        "--onefile",
-        f"--name={app_name}"
-    ]
-    if icon_path:
-        pyinstaller_cmd.append(f"--icon={icon_path}")
-    if no_console_flag:
-        pyinstaller_cmd.append(no_console_flag)
-    pyinstaller_cmd.append(py_script)
-
+    pyinstaller_cmd = _pyinstaller_cmd(py_script, app_name, icon_path, no_console_flag, trim, extra_excludes)
     try:
-        subprocess.check_call(pyinstaller_cmd)
-    except subprocess.CalledProcessError as e:
-        messagebox.showerror("Error", f"PyInstaller failed: {e} 😢")
+        cached_exe = _build_cache_path(pyinstaller_cmd)
+    except OSError as e:
+        messagebox.showerror("Error", f"Failed to read the script: {e} 😢")
         return
 
-    dist_dir = os.path.join(work_dir, "dist")
-    exe_path = os.path.join(dist_dir, app_name)
-    if not os.path.exists(exe_path):
-        # Try with extension (if on Windows)
-        exe_path = os.path.join(dist_dir, app_name + ".exe")
-        if not os.path.exists(exe_path):
-            messagebox.showerror("Error", "Executable not found after PyInstaller. 😢")
-            return
+    # Reuse the previous build if neither the script nor the options changed, unless the user wants a fresh one.
+    reuse = _use_cached_build(cached_exe) and messagebox.askyesno(
+        "Reuse Build?", "This script was already built with these options. Reuse that build? (No = rebuild)")
+    if not reuse:
+        work_dir = _make_work_dir()
+        try:
+            try:
+                if not _run_with_progress(root, _with_work_paths(pyinstaller_cmd, work_dir), f"Building {app_name}"):
+                    messagebox.showinfo("Cancelled", "Build cancelled. 😕")
+                    return
+            except subprocess.CalledProcessError as e:
+                messagebox.showerror("Error", f"PyInstaller failed: {e} 😢\n\n{_output_tail(e)}")
+                return
+
+            exe_path = _find_executable(_dist_dir(work_dir), app_name)
+            if exe_path is None:
+                messagebox.showerror("Error", "Executable not found after PyInstaller. 😢")
+                return
+
+            try:
+                _store_build(exe_path, cached_exe)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to move the executable: {e} 😢")
+                return
+        finally:
+            _fast_rmtree(work_dir, _dist_dir(work_dir))
 
-    final_dir = os.path.join(os.path.expanduser("~"), ".local", "share", "applications", "py_apps")
-    os.makedirs(final_dir, exist_ok=True)
-    final_exe_path = os.path.join(final_dir, app_name)
     try:
-        shutil.move(exe_path, final_exe_path)
-        os.chmod(final_exe_path, 0o755)
+        final_exe_path = _install_executable(cached_exe, app_name)
     except Exception as e:
-        messagebox.showerror("Error", f"Failed to move the executable: {e} 😢")
+        messagebox.showerror("Error", f"Failed to copy the executable: {e} 😢")
         return
 
-    # Cleanup build files
-    for folder in ["build", "dist"]:
-        folder_path = os.path.join(work_dir, folder)
-        if os.path.exists(folder_path):
-            shutil.rmtree(folder_path)
-    spec_file = os.path.join(work_dir, f"{app_name}.spec")
-    if os.path.exists(spec_file):
-        os.remove(spec_file)
-
-    desktop_entry = f"""[Desktop Entry]
-Type=Application
-Name={app_name}
-Exec="{final_exe_path}"
-Icon={icon_path if icon_path else "utilities-terminal"}
-Terminal=false
-Categories=Utility;
-"""
-    applications_dir = os.path.join(os.path.expanduser("~"), ".local", "share", "applications")
-    os.makedirs(applications_dir, exist_ok=True)
-    desktop_file_path = os.path.join(applications_dir, f"{app_name}.desktop")
     try:
-        with open(desktop_file_path, "w") as f:
-            f.write(desktop_entry)
-        os.chmod(desktop_file_path, 0o755)
+        _write_python_desktop_entry(app_name, final_exe_path, icon_path, use_terminal)
     except Exception as e:
         messagebox.showerror("Error", f"Failed to create .desktop file: {e} 😢")
         return
 
     messagebox.showinfo("Success", f"App '{app_name}' created successfully!\nExecutable at:\n{final_exe_path}\nDesktop entry created. 🚀")
-    root.destroy()
 
 def convert_python_appimage():
     """Convert a Python script into an AppImage using PyInstaller and linuxdeploy."""
-    root = tk.Tk()
-    root.withdraw()
+    from tkinter import filedialog, simpledialog, messagebox
+    root = _get_root()
 
     py_script = filedialog.askopenfilename(
         title="Select the Python script to convert for AppImage",
@@ -162,89 +665,161 @@ def convert_python_appimage():
 
     use_terminal = messagebox.askyesno("Terminal?", "Should the app run in a terminal window? (No = hidden)")
     no_console_flag = "--noconsole" if not use_terminal else ""
+    trim, extra_excludes = _ask_build_options(root)
 
     check_install_pyinstaller()
     check_linuxdeploy()
 
-    work_dir = os.getcwd()
-    pyinstaller_cmd = [
-        "pyinstaller",
-        "--onefile",
-        f"--name={app_name}"
-    ]
-    if icon_path:
-        pyinstaller_cmd.append(f"--icon={icon_path}")
-    if no_console_flag:
-        pyinstaller_cmd.append(no_console_flag)
-    pyinstaller_cmd.append(py_script)
-
+    # The AppImage is written to the current directory; intermediate files stay in work_dir.
+    output_dir = os.getcwd()
+    work_dir = _make_work_dir()
     try:
-        subprocess.check_call(pyinstaller_cmd)
-    except subprocess.CalledProcessError as e:
-        messagebox.showerror("Error", f"PyInstaller failed: {e} 😢")
-        return
+        pyinstaller_cmd = _pyinstaller_cmd(py_script, app_name, icon_path, no_console_flag, trim, extra_excludes)
+        try:
+            cached_exe = _build_cache_path(pyinstaller_cmd)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to read the script: {e} 😢")
+            return
+
+        # Reuse the previous build if neither the script nor the options changed, unless the user wants a fresh one.
+        reuse = _use_cached_build(cached_exe) and messagebox.askyesno(
+            "Reuse Build?", "This script was already built with these options. Reuse that build? (No = rebuild)")
+        if not reuse:
+            try:
+                if not _run_with_progress(root, _with_work_paths(pyinstaller_cmd, work_dir), f"Building {app_name}"):
+                    messagebox.showinfo("Cancelled", "Build cancelled. 😕")
+                    return
+            except subprocess.CalledProcessError as e:
+                messagebox.showerror("Error", f"PyInstaller failed: {e} 😢\n\n{_output_tail(e)}")
+                return
+
+            exe_path = _find_executable(_dist_dir(work_dir), app_name)
+            if exe_path is None:
+                messagebox.showerror("Error", "Executable not found after PyInstaller. 😢")
+                return
 
-    dist_dir = os.path.join(work_dir, "dist")
-    exe_path = os.path.join(dist_dir, app_name)
-    if not os.path.exists(exe_path):
-        exe_path = os.path.join(dist_dir, app_name + ".exe")
-        if not os.path.exists(exe_path):
-            messagebox.showerror("Error", "Executable not found after PyInstaller. 😢")
+            try:
+                _store_build(exe_path, cached_exe)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to move the executable: {e} 😢")
+                return
+
+        # Create AppDir structure
+        appdir = os.path.join(work_dir, f"{app_name}.AppDir")
+        usr_bin = os.path.join(appdir, "usr", "bin")
+        os.makedirs(usr_bin, exist_ok=True)
+        final_exe_path = os.path.join(usr_bin, app_name)
+        try:
+            _copy_file(cached_exe, final_exe_path)
+            os.chmod(final_exe_path, 0o755)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to copy the executable: {e} 😢")
             return
 
-    # Create AppDir structure
-    appdir = os.path.join(work_dir, f"{app_name}.AppDir")
-    usr_bin = os.path.join(appdir, "usr", "bin")
-    os.makedirs(usr_bin, exist_ok=True)
-    final_exe_path = os.path.join(usr_bin, app_name)
-    try:
-        shutil.move(exe_path, final_exe_path)
-        os.chmod(final_exe_path, 0o755)
-    except Exception as e:
-        messagebox.showerror("Error", f"Failed to move the executable: {e} 😢")
+        # Create a .desktop file inside AppDir
+        desktop_entry = _build_desktop(app_name, app_name, icon_path, use_terminal)
+        desktop_file_dir = os.path.join(appdir, "usr", "share", "applications")
+        os.makedirs(desktop_file_dir, exist_ok=True)
+        desktop_file_path = os.path.join(desktop_file_dir, f"{app_name}.desktop")
+        try:
+            _write_desktop(desktop_file_path, desktop_entry)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to create .desktop file in AppDir: {e} 😢")
+            return
+
+        # Run linuxdeploy to package the AppDir into an AppImage.
+        try:
+            linuxdeploy_cmd = ["linuxdeploy", "--appdir", appdir, "--output", "appimage"]
+            if not _run_with_progress(root, linuxdeploy_cmd, f"Packaging {app_name}"):
+                messagebox.showinfo("Cancelled", "AppImage packaging cancelled. 😕")
+                return
+        except subprocess.CalledProcessError as e:
+            messagebox.showerror("Error", f"linuxdeploy failed: {e} 😢\n\n{_output_tail(e)}")
+            return
+
+        messagebox.showinfo("Success", f"AppImage for '{app_name}' created successfully in {output_dir}! 🚀")
+    finally:
+        _fast_rmtree(work_dir, _dist_dir(work_dir))
+
+def batch_convert_python_apps():
+    """Convert several Python scripts into executables in parallel."""
+    import tkinter as tk
+    from tkinter import filedialog, messagebox
+    root = _get_root()
+
+    py_scripts = filedialog.askopenfilenames(
+        title="Select the Python scripts to convert",
+        filetypes=[("Python Files", "*.py")],
+        initialdir=os.path.expanduser("~")
+    )
+    if not py_scripts:
+        messagebox.showinfo("Cancelled", "No Python scripts selected. Exiting. 😕")
         return
 
-    # Create a .desktop file inside AppDir
-    desktop_entry = f"""[Desktop Entry]
-Type=Application
-Name={app_name}
-Exec={app_name}
-Icon={icon_path if icon_path else "utilities-terminal"}
-Terminal=false
-Categories=Utility;
-"""
-    desktop_file_dir = os.path.join(appdir, "usr", "share", "applications")
-    os.makedirs(desktop_file_dir, exist_ok=True)
-    desktop_file_path = os.path.join(desktop_file_dir, f"{app_name}.desktop")
-    try:
-        with open(desktop_file_path, "w") as f:
-            f.write(desktop_entry)
-    except Exception as e:
-        messagebox.showerror("Error", f"Failed to create .desktop file in AppDir: {e} 😢")
+    # Each app is named after its script, so names must not clash.
+    app_names = [os.path.splitext(os.path.basename(py_script))[0] for py_script in py_scripts]
+    if len(set(app_names)) != len(app_names):
+        messagebox.showerror("Error", "Selected scripts must have different file names. 😢")
         return
 
-    # Run linuxdeploy to package the AppDir into an AppImage.
+    use_terminal = messagebox.askyesno("Terminal?", "Should the apps run in a terminal window? (No = hidden)")
+    no_console_flag = "--noconsole" if not use_terminal else ""
+    trim, extra_excludes = _ask_build_options(root)
+
+    rebuild = False
     try:
-        subprocess.check_call(["linuxdeploy", "--appdir", appdir, "--output", "appimage"])
-    except subprocess.CalledProcessError as e:
-        messagebox.showerror("Error", f"linuxdeploy failed: {e} 😢")
+        any_cached = any(os.path.exists(_build_cache_path(_pyinstaller_cmd(py_script, app_name, None, no_console_flag,
+                                                                           trim, extra_excludes)))
+                         for py_script, app_name in zip(py_scripts, app_names))
+    except OSError as e:
+        messagebox.showerror("Error", f"Failed to read the scripts: {e} 😢")
         return
+    if any_cached:
+        rebuild = not messagebox.askyesno(
+            "Reuse Builds?", "Some scripts were already built with these options. Reuse those builds? (No = rebuild all)")
 
-    messagebox.showinfo("Success", f"AppImage for '{app_name}' created successfully in {work_dir}! 🚀")
-    # Cleanup temporary files
-    for folder in ["build", "dist"]:
-        folder_path = os.path.join(work_dir, folder)
-        if os.path.exists(folder_path):
-            shutil.rmtree(folder_path)
-    spec_file = os.path.join(work_dir, f"{app_name}.spec")
-    if os.path.exists(spec_file):
-        os.remove(spec_file)
-    root.destroy()
+    check_install_pyinstaller()
+
+    window = tk.Toplevel(root)
+    window.title("Batch Convert")
+    status = tk.StringVar(window, value=f"Building {len(py_scripts)} apps... ⏳")
+    tk.Label(window, textvariable=status, width=60, anchor="w").pack(padx=10, pady=10)
+
+    failures = []
+
+    async def build_all():
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            jobs = [
+                _job_result(app_name, loop.run_in_executor(
+                    pool, _bundle_one, py_script, app_name, None, no_console_flag, _make_work_dir(),
+                    trim, extra_excludes, rebuild))
+                for py_script, app_name in zip(py_scripts, app_names)
+            ]
+            for finished, job in enumerate(asyncio.as_completed(jobs), start=1):
+                app_name, error = await job
+                if isinstance(error, subprocess.CalledProcessError):
+                    # PyInstaller's last line of output usually names the problem.
+                    last_lines = _output_tail(error).strip().splitlines()
+                    failures.append(f"{app_name}: {last_lines[-1] if last_lines else error}")
+                elif error is not None:
+                    failures.append(f"{app_name}: {error}")
+                status.set(f"Finished {finished} of {len(jobs)} apps... ⏳")
+
+    try:
+        _run_async(root, build_all())
+    finally:
+        window.destroy()
+
+    if failures:
+        messagebox.showerror("Error", "Some apps failed to build: 😢\n" + "\n".join(failures))
+    else:
+        messagebox.showinfo("Success", f"{len(py_scripts)} apps created successfully! 🚀")
 
 def create_bash_app():
     """Create a desktop entry for a Bash script."""
-    root = tk.Tk()
-    root.withdraw()
+    from tkinter import filedialog, simpledialog, messagebox
+    root = _get_root()
 
     bash_script = filedialog.askopenfilename(
         title="Select the Bash script",
@@ -276,32 +851,22 @@ def create_bash_app():
         messagebox.showerror("Error", f"Failed to set executable permission: {e} 😢")
         return
 
-    desktop_entry = f"""[Desktop Entry]
-Type=Application
-Name={app_name}
-Exec="{bash_script}"
-Icon={icon_path}
-Terminal=true
-Categories=Utility;
-"""
+    desktop_entry = _build_desktop(app_name, f'"{bash_script}"', icon_path, True)
     applications_dir = os.path.join(os.path.expanduser("~"), ".local", "share", "applications")
-    os.makedirs(applications_dir, exist_ok=True)
+    _ensure_dir(applications_dir)
     desktop_file_path = os.path.join(applications_dir, f"{app_name}.desktop")
     try:
-        with open(desktop_file_path, "w") as f:
-            f.write(desktop_entry)
-        os.chmod(desktop_file_path, 0o755)
+        _write_desktop(desktop_file_path, desktop_entry)
     except Exception as e:
         messagebox.showerror("Error", f"Failed to create desktop entry: {e} 😢")
         return
 
     messagebox.showinfo("Success", f"Bash app '{app_name}' created successfully! 🚀")
-    root.destroy()
 
 def create_jar_app():
     """Create a desktop entry to launch a Java JAR file."""
-    root = tk.Tk()
-    root.withdraw()
+    from tkinter import filedialog, simpledialog, messagebox
+    root = _get_root()
 
     jar_file = filedialog.askopenfilename(
         title="Select the JAR file",
@@ -326,32 +891,22 @@ def create_jar_app():
         if chosen_icon:
             icon_path = chosen_icon
 
-    desktop_entry = f"""[Desktop Entry]
-Type=Application
-Name={app_name}
-Exec=java -jar "{jar_file}"
-Icon={icon_path}
-Terminal=false
-Categories=Utility;
-"""
+    desktop_entry = _build_desktop(app_name, f'java -jar "{jar_file}"', icon_path, False)
     applications_dir = os.path.join(os.path.expanduser("~"), ".local", "share", "applications")
-    os.makedirs(applications_dir, exist_ok=True)
+    _ensure_dir(applications_dir)
     desktop_file_path = os.path.join(applications_dir, f"{app_name}.desktop")
     try:
-        with open(desktop_file_path, "w") as f:
-            f.write(desktop_entry)
-        os.chmod(desktop_file_path, 0o755)
+        _write_desktop(desktop_file_path, desktop_entry)
     except Exception as e:
         messagebox.showerror("Error", f"Failed to create desktop entry: {e} 😢")
         return
 
     messagebox.showinfo("Success", f"Java app '{app_name}' created successfully! 🚀")
-    root.destroy()
 
 def convert_appimage_to_app():
     """Convert an existing AppImage into a desktop application entry."""
-    root = tk.Tk()
-    root.withdraw()
+    from tkinter import filedialog, simpledialog, messagebox
+    root = _get_root()
 
     appimage_file = filedialog.askopenfilename(
         title="Select the AppImage file",
@@ -376,6 +931,8 @@ def convert_appimage_to_app():
         if not icon_path:
             icon_path = None
 
+    move_original = messagebox.askyesno("Move?", "Move the AppImage instead of copying it? (No = keep the original)")
+
     # Ensure the AppImage is executable
     try:
         os.chmod(appimage_file, 0o755)
@@ -388,51 +945,87 @@ def convert_appimage_to_app():
     os.makedirs(final_dir, exist_ok=True)
     final_appimage_path = os.path.join(final_dir, os.path.basename(appimage_file))
     try:
-        shutil.copy(appimage_file, final_appimage_path)
+        # An AppImage already in the folder (e.g. registered again under a new name) stays where it is.
+        already_there = os.path.exists(final_appimage_path) and os.path.samefile(appimage_file, final_appimage_path)
+        if not already_there:
+            if move_original:
+                _move_file(appimage_file, final_appimage_path)
+            else:
+                _copy_file(appimage_file, final_appimage_path)
         os.chmod(final_appimage_path, 0o755)
     except Exception as e:
-        messagebox.showerror("Error", f"Failed to copy the AppImage: {e} 😢")
+        messagebox.showerror("Error", f"Failed to {'move' if move_original else 'copy'} the AppImage: {e} 😢")
         return
 
     # Create a desktop entry for the AppImage
-    desktop_entry = f"""[Desktop Entry]
-Type=Application
-Name={app_name}
-Exec="{final_appimage_path}"
-Icon={icon_path if icon_path else "utilities-terminal"}
-Terminal=false
-Categories=Utility;
-"""
+    desktop_entry = _build_desktop(app_name, f'"{final_appimage_path}"', icon_path, False)
     applications_dir = os.path.join(os.path.expanduser("~"), ".local", "share", "applications")
-    os.makedirs(applications_dir, exist_ok=True)
+    _ensure_dir(applications_dir)
     desktop_file_path = os.path.join(applications_dir, f"{app_name}.desktop")
     try:
-        with open(desktop_file_path, "w") as f:
-            f.write(desktop_entry)
-        os.chmod(desktop_file_path, 0o755)
+        _write_desktop(desktop_file_path, desktop_entry)
     except Exception as e:
         messagebox.showerror("Error", f"Failed to create desktop entry: {e} 😢")
         return
 
     messagebox.showinfo("Success", f"AppImage '{app_name}' converted to an application successfully! 🚀")
-    root.destroy()
+
+def _choose_from_list(root, title, items):
+    """Show items in a modal list and return the one the user picks, or None."""
+    import tkinter as tk
+    window = tk.Toplevel(root)
+    window.title(title)
+
+    frame = tk.Frame(window)
+    frame.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+    listbox = tk.Listbox(frame, width=60, height=20)
+    scrollbar = tk.Scrollbar(frame, command=listbox.yview)
+    listbox.config(yscrollcommand=scrollbar.set)
+    listbox.insert(tk.END, *items)
+    listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    choice = {}
+
+    def select(event=None):
+        selection = listbox.curselection()
+        if selection:
+            choice["item"] = items[selection[0]]
+            window.destroy()
+
+    listbox.bind("<Double-1>", select)
+    listbox.bind("<Return>", select)
+    tk.Button(window, text="Select", width=20, command=select).pack(side=tk.LEFT, padx=10, pady=5)
+    tk.Button(window, text="Cancel", width=20, command=window.destroy).pack(side=tk.RIGHT, padx=10, pady=5)
+
+    listbox.focus_set()
+    # A grab fails on X11 until the window is mapped.
+    window.wait_visibility()
+    window.grab_set()
+    window.wait_window()
+    return choice.get("item")
 
 def delete_app():
+    from tkinter import messagebox
+    root = _get_root()
     applications_dir = os.path.join(os.path.expanduser("~"), ".local", "share", "applications")
     if not os.path.isdir(applications_dir):
         messagebox.showinfo("Info", "Applications folder not found. 😕")
         return
 
-    root = tk.Tk()
-    root.withdraw()
-    selected_file = filedialog.askopenfilename(
-        title="Select a .desktop file to delete",
-        initialdir=applications_dir,
-        filetypes=[("Desktop Files", "*.desktop")]
-    )
-    if not selected_file:
+    # One directory scan; DirEntry.is_file() reuses the type the scan already returned.
+    with os.scandir(applications_dir) as entries:
+        desktop_files = sorted(entry.name for entry in entries
+                               if entry.name.endswith(".desktop") and entry.is_file(follow_symlinks=False))
+    if not desktop_files:
+        messagebox.showinfo("Info", "No .desktop files found. 😕")
+        return
+
+    selected_name = _choose_from_list(root, "Select a .desktop file to delete", desktop_files)
+    if not selected_name:
         messagebox.showinfo("Cancelled", "No file selected. 😕")
         return
+    selected_file = os.path.join(applications_dir, selected_name)
 
     if not messagebox.askyesno("Confirm", f"Delete the file:\n{os.path.basename(selected_file)}? This action cannot be undone."):
         return
@@ -442,21 +1035,75 @@ def delete_app():
         messagebox.showinfo("Deleted", f"File '{os.path.basename(selected_file)}' deleted successfully! 🚮")
     except Exception as e:
         messagebox.showerror("Error", f"Failed to delete the file: {e} 😢")
-    root.destroy()
+
+def _run_from_menu(menu, converter):
+    """Hide the menu while converter runs, then show it again."""
+    menu.withdraw()
+    try:
+        converter()
+    finally:
+        menu.deiconify()
 
 def main_menu():
-    menu = tk.Tk()
+    global _ROOT
+    import tkinter as tk
+    menu = _ROOT = tk.Tk()
     menu.title("Custom App Manager")
     tk.Label(menu, text="Choose an operation:", font=("Arial", 12)).pack(padx=10, pady=10)
 
-    tk.Button(menu, text="Convert Python Script to App", width=40, command=lambda: [menu.destroy(), convert_python_app()]).pack(pady=5)
-    tk.Button(menu, text="Convert Python Script to AppImage", width=40, command=lambda: [menu.destroy(), convert_python_appimage()]).pack(pady=5)
-    tk.Button(menu, text="Create Bash Script App", width=40, command=lambda: [menu.destroy(), create_bash_app()]).pack(pady=5)
-    tk.Button(menu, text="Create Java App (JAR)", width=40, command=lambda: [menu.destroy(), create_jar_app()]).pack(pady=5)
-    tk.Button(menu, text="Convert AppImage to Application", width=40, command=lambda: [menu.destroy(), convert_appimage_to_app()]).pack(pady=5)
-    tk.Button(menu, text="Delete Existing App", width=40, command=lambda: [menu.destroy(), delete_app()]).pack(pady=5)
+    tk.Button(menu, text="Convert Python Script to App", width=40, command=lambda: _run_from_menu(menu, convert_python_app)).pack(pady=5)
+    tk.Button(menu, text="Batch Convert Python Scripts", width=40, command=lambda: _run_from_menu(menu, batch_convert_python_apps)).pack(pady=5)
+    tk.Button(menu, text="Convert Python Script to AppImage", width=40, command=lambda: _run_from_menu(menu, convert_python_appimage)).pack(pady=5)
+    tk.Button(menu, text="Create Bash Script App", width=40, command=lambda: _run_from_menu(menu, create_bash_app)).pack(pady=5)
+    tk.Button(menu, text="Create Java App (JAR)", width=40, command=lambda: _run_from_menu(menu, create_jar_app)).pack(pady=5)
+    tk.Button(menu, text="Convert AppImage to Application", width=40, command=lambda: _run_from_menu(menu, convert_appimage_to_app)).pack(pady=5)
+    tk.Button(menu, text="Delete Existing App", width=40, command=lambda: _run_from_menu(menu, delete_app)).pack(pady=5)
 
     menu.mainloop()
 
+def run_cli(argv=None):
+    """Convert one Python script from the command line without starting Tk."""
+    parser = argparse.ArgumentParser(
+        description="Convert a Python script into an executable with a desktop entry. "
+                    "Run with no arguments or with --gui for the graphical menu."
+    )
+    parser.add_argument("--script", required=True, help="Python script to convert")
+    parser.add_argument("--name", help="app name (default: the script's file name)")
+    parser.add_argument("--icon", help="icon image for the app")
+    parser.add_argument("--no-console", action="store_true", help="do not run the app in a terminal window")
+    parser.add_argument("--no-trim", action="store_true",
+                        help=f"keep {', '.join(DEFAULT_EXCLUDES)} and UPX compression")
+    parser.add_argument("--exclude-module", action="append", default=[], metavar="MODULE",
+                        help="extra module to leave out of the bundle (repeatable)")
+    parser.add_argument("--rebuild", action="store_true", help="ignore any cached build and run PyInstaller again")
+    args = parser.parse_args(argv)
+
+    py_script = os.path.abspath(args.script)
+    if not os.path.isfile(py_script):
+        print(f"Error: Python script not found: {py_script}", file=sys.stderr)
+        return 1
+    if not _pyinstaller_available():
+        print("Error: PyInstaller is required to convert scripts. "
+              "Install it with: python3 -m pip install --user pyinstaller", file=sys.stderr)
+        return 1
+
+    app_name = args.name or os.path.splitext(os.path.basename(py_script))[0]
+    icon_path = os.path.abspath(args.icon) if args.icon else None
+    no_console_flag = "--noconsole" if args.no_console else ""
+    try:
+        final_exe_path = _bundle_one(py_script, app_name, icon_path, no_console_flag, _make_work_dir(),
+                                     not args.no_trim, args.exclude_module, args.rebuild)
+    except subprocess.CalledProcessError as e:
+        print(f"Error: PyInstaller failed: {e}\n{_output_tail(e)}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error: Failed to create app '{app_name}': {e}", file=sys.stderr)
+        return 1
+
+    print(f"App '{app_name}' created successfully!\nExecutable at:\n{final_exe_path}")
+    return 0
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] != "--gui":
+        sys.exit(run_cli())
     main_menu()